@@ -0,0 +1,71 @@
+# bench/daemon.py
+#
+# Latency and throughput of the warm daemon against cold solver.py runs.
+#
+#   python -m bench.daemon --files cnf/austin.cnf cnf/cnf_2.cnf --runs 20 --concurrency 8
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from client import request
+
+
+def cold(path: str, options: list) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "solver.py", "-f", path] + options, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def warm(path: str, payload_options: dict, socket_path: str) -> float:
+    start = time.perf_counter()
+    response = request({"op": "solve", "file": path, "options": payload_options}, socket_path)
+    assert response["ok"], response
+    return time.perf_counter() - start
+
+
+def report(name: str, latencies: list, wall: float):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    print(f"{name:<24} {1000 * statistics.median(latencies):>10.1f} {1000 * p95:>10.1f} "
+          f"{len(latencies) / wall:>10.1f}", flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Daemon benchmark")
+    parser.add_argument("--files", type=str, nargs="+", default=["cnf/austin.cnf", "cnf/cnf_2.cnf"])
+    parser.add_argument("--closure", type=str, default="full")
+    parser.add_argument("--order", type=str, default="input")
+    parser.add_argument("--runs", type=int, default=10, help="Requests per file")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients for the throughput run")
+    args = parser.parse_args()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "ressat.sock")
+    daemon = subprocess.Popen([sys.executable, "daemon.py", "--socket", socket_path], stdout=subprocess.DEVNULL)
+    while not os.path.exists(socket_path):
+        time.sleep(0.05)
+
+    cli_options = ["--closure", args.closure, "--order", args.order]
+    options = {"closure": args.closure, "ordering": args.order}
+    jobs = [path for path in args.files for _ in range(args.runs)]
+    try:
+        print(f"{'mode':<24} {'p50 (ms)':>10} {'p95 (ms)':>10} {'req/s':>10}")
+        start = time.perf_counter()
+        report("cold solver.py", [cold(path, cli_options) for path in jobs], time.perf_counter() - start)
+
+        start = time.perf_counter()
+        report("daemon sequential", [warm(path, options, socket_path) for path in jobs], time.perf_counter() - start)
+
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            start = time.perf_counter()
+            latencies = list(pool.map(lambda path: warm(path, options, socket_path), jobs))
+            report(f"daemon x{args.concurrency}", latencies, time.perf_counter() - start)
+    finally:
+        daemon.terminate()
+        daemon.wait()
@@ -0,0 +1,66 @@
+# bench/enumerate.py
+#
+# Models/sec of RSSolver.models, which extends the directional closure with
+# each blocking clause, against re-running the pipeline on a CNF file with
+# the blocking clauses appended.
+#
+#   python -m bench.enumerate --files "uf20-91/uf20-0[1-9].cnf" --baseline 20
+
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from utils import Parser, RSSolver
+
+
+def incremental(path: str, order: str) -> int:
+    solver = RSSolver(path, parser=Parser(path, ordering=order, closure="directional", verbose=False))
+    return sum(1 for _ in solver.models())
+
+
+def rerun(path: str, order: str, limit: int) -> int:
+    """
+    The old workflow: append a blocking clause to the file and solve again.
+    """
+    num_vars = Parser(path, closure="none", verbose=False).num_vars
+    with open(path) as file:
+        lines = [line for line in file if not line.startswith(('c', 'p', '%')) and line.strip() not in ("", "0")]
+    fd, tmp = tempfile.mkstemp(suffix=".cnf")
+    os.close(fd)
+    count = 0
+    try:
+        while count < limit:
+            with open(tmp, 'w') as file:
+                file.write(f"p cnf {num_vars} {len(lines)}\n")
+                file.writelines(lines)
+            solver = RSSolver(tmp, parser=Parser(tmp, ordering=order, closure="directional", verbose=False))
+            sat, _ = solver.solve()
+            if not sat:
+                break
+            count += 1
+            lines.append(" ".join(str(-lit) for lit in solver.T) + " 0\n")
+    finally:
+        os.remove(tmp)
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Model enumeration benchmark")
+    parser.add_argument("--files", type=str, default="uf20-91/uf20-0[1-9].cnf", help="Glob of CNF files")
+    parser.add_argument("--order", type=str, default="min-fill")
+    parser.add_argument("--baseline", type=int, default=0, help="Also time this many models by re-running")
+    args = parser.parse_args()
+
+    print(f"{'file':<16} {'mode':<12} {'models':>7} {'time (s)':>9} {'models/s':>9}")
+    for path in sorted(glob.glob(args.files)):
+        name = path.split('/')[-1]
+        runs = [("incremental", lambda: incremental(path, args.order))]
+        if args.baseline:
+            runs.append(("rerun", lambda: rerun(path, args.order, args.baseline)))
+        for mode, run in runs:
+            start = time.perf_counter()
+            count = run()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<16} {mode:<12} {count:>7} {elapsed:>9.3f} {count / elapsed:>9.1f}", flush=True)
@@ -0,0 +1,44 @@
+# bench/ordering.py
+#
+# Compares the directional resolution closure under the input variable order
+# against the optimized orders from utils.Ordering.
+#
+#   python -m bench.ordering --files "aim/aim-50-*.cnf" --timeout 60
+
+import argparse
+import glob
+import multiprocessing
+import time
+
+from utils.Ordering import ORDERINGS, induced_width, primal_graph
+from utils.Parser import Parser
+
+
+def run(path: str, order: str):
+    start = time.perf_counter()
+    p = Parser(path, ordering=order, closure="directional", verbose=False)
+    elapsed = time.perf_counter() - start
+    width = induced_width(primal_graph(p.data, p.num_vars), list(range(1, p.num_vars + 1)))
+    return width, len(p.R), elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Variable ordering benchmark")
+    parser.add_argument("--files", type=str, default="aim/aim-50-*.cnf", help="Glob of CNF files")
+    parser.add_argument("--orders", type=str, nargs="+", default=list(ORDERINGS), choices=list(ORDERINGS))
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds allowed per closure")
+    args = parser.parse_args()
+
+    print(f"{'file':<28} {'order':<11} {'width':>5} {'|R|':>9} {'time (s)':>9}")
+    pool = multiprocessing.Pool(1)
+    for path in sorted(glob.glob(args.files)):
+        for order in args.orders:
+            name = path.split('/')[-1]
+            try:
+                width, size, elapsed = pool.apply_async(run, (path, order)).get(args.timeout)
+                print(f"{name:<28} {order:<11} {width:>5} {size:>9} {elapsed:>9.3f}", flush=True)
+            except multiprocessing.TimeoutError:
+                print(f"{name:<28} {order:<11} {'-':>5} {'-':>9} {'timeout':>9}", flush=True)
+                pool.terminate()
+                pool = multiprocessing.Pool(1)
+    pool.terminate()
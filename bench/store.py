@@ -0,0 +1,102 @@
+# bench/store.py
+#
+# Compares the frozenset clause store against utils.ClauseStore: bytes per
+# clause and time spent in the garbage collector, first on a synthetic load
+# of millions of clauses, then on real closures. Real closures that finish in
+# minutes stay in the thousands of clauses, so only the synthetic load reaches
+# millions; the closure timings include the arena's occurrence lists.
+#
+#   python -m bench.store --clauses 2000000 --files cnf/cnf_2.cnf cnf/austin.cnf
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from utils.ClauseStore import ClauseStore
+from utils.Parser import Parser
+
+
+class GCTimer:
+    """
+    Accumulates the time spent in garbage collection through gc.callbacks.
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self.start = 0.0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self.start = time.perf_counter()
+        else:
+            self.total += time.perf_counter() - self.start
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def synthetic(num_clauses: int, num_vars: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(num_clauses):
+        width = rng.randint(3, 8)
+        yield [v if rng.random() < 0.5 else -v for v in rng.sample(range(1, num_vars + 1), width)]
+
+
+def load_frozenset(clauses) -> int:
+    store = set()
+    for clause in clauses:
+        store.add(frozenset(clause))
+    return len(store)
+
+
+def load_arena(clauses) -> int:
+    store = ClauseStore()
+    for clause in clauses:
+        store.add(clause)
+    return len(store)
+
+
+def measure(fn, *args):
+    # tracemalloc slows allocation down, so time and memory are taken in separate runs
+    with GCTimer() as timer:
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed, timer.total
+
+
+def closure(path: str, store: str) -> int:
+    return len(Parser(path, store=store, verbose=False).R)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clause store benchmark")
+    parser.add_argument("--clauses", type=int, default=2_000_000, help="Synthetic clauses to insert")
+    parser.add_argument("--vars", type=int, default=200, help="Variables in the synthetic load")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--files", type=str, nargs="*", default=[], help="CNF files to close with both stores")
+    args = parser.parse_args()
+
+    print(f"{'workload':<28} {'store':<10} {'clauses':>9} {'B/clause':>9} {'time (s)':>9} {'gc (s)':>8}")
+    for name, fn in (("frozenset", load_frozenset), ("arena", load_arena)):
+        clauses = list(synthetic(args.clauses, args.vars, args.seed))
+        size, peak, elapsed, gc_time = measure(fn, clauses)
+        del clauses
+        print(f"{'synthetic':<28} {name:<10} {size:>9} {peak / size:>9.1f} {elapsed:>9.2f} {gc_time:>8.2f}", flush=True)
+
+    for path in args.files:
+        for name in ("frozenset", "arena"):
+            size, peak, elapsed, gc_time = measure(closure, path, name)
+            print(f"{path.split('/')[-1]:<28} {name:<10} {size:>9} {peak / size:>9.1f} {elapsed:>9.2f} {gc_time:>8.2f}",
+                  flush=True)
@@ -0,0 +1,55 @@
+# client.py
+#
+# Thin client for daemon.py. Only uses the standard library, so it starts
+# without importing the solver.
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET = "/tmp/ressat.sock"  # Same as utils.Daemon.DEFAULT_SOCKET
+
+
+def request(payload: dict, socket_path: str = DEFAULT_SOCKET) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile('rb') as stream:
+            return json.loads(stream.readline())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RES-SAT daemon client")
+    parser.add_argument("-f", type=str, help="Path to the CNF file")
+    parser.add_argument("--op", type=str, default="solve", choices=["solve", "validate", "stats"])
+    parser.add_argument("--model", type=int, nargs="*", help="Model to validate (literals)")
+    parser.add_argument("--order", type=str, default="input", help="Variable order heuristic used by RES-SAT")
+    parser.add_argument("--closure", type=str, default="full", help="Resolution closure to compute")
+    parser.add_argument("--store", type=str, default="frozenset", help="Clause store used by the full closure")
+    parser.add_argument("--socket", type=str, default=DEFAULT_SOCKET, help="Path of the daemon's socket")
+    args = parser.parse_args()
+
+    payload = {"op": args.op}
+    if args.op != "stats":
+        if args.f is None:
+            parser.error("-f is required")
+        payload["file"] = os.path.abspath(args.f)  # The daemon resolves paths from its own directory
+        payload["options"] = {"ordering": args.order, "closure": args.closure, "store": args.store}
+    if args.op == "validate":
+        payload["model"] = args.model or []
+
+    response = request(payload, args.socket)
+    if not response["ok"]:
+        print(response["error"], file=sys.stderr)
+        sys.exit(1)
+
+    if args.op == "solve":
+        print(response["sat"])
+        for i, b in enumerate(response["res"]):
+            print(f"{i} | {b}")
+    elif args.op == "validate":
+        print(response["valid"])
+    else:
+        print(json.dumps(response, indent=2))
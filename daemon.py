@@ -0,0 +1,23 @@
+# daemon.py
+
+import argparse
+import asyncio
+import os
+import sys
+
+from utils.Daemon import DEFAULT_SOCKET, SolverDaemon
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RES-SAT solver daemon")
+    parser.add_argument("--socket", type=str, default=DEFAULT_SOCKET, help="Path of the Unix domain socket")
+    parser.add_argument("--cache", type=int, default=16, help="Number of instances kept warm")
+    parser.add_argument("--workers", type=int, default=4, help="Threads used for parsing and solving")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(SolverDaemon(args.socket, args.cache, args.workers).serve())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    # A closure still running in a worker thread would otherwise keep the interpreter alive
+    sys.stdout.flush()
+    os._exit(0)
@@ -1,16 +1,90 @@
 # solver.py
 
 import argparse
+import json
 
-from utils import RSSolver
+from utils import Parser, RSSolver
+from utils.LocalSearch import LocalSearch
+from utils.Ordering import ORDERINGS
+from utils.Portfolio import ENGINES, race
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="RES-SAT Solver")
     parser.add_argument("-f", type=str, required=True, help="Path to the CNF file")
+    parser.add_argument("--engine", type=str, default="res-sat", choices=["res-sat", "local", "portfolio"],
+                        help="RES-SAT over a resolution closure, stochastic local search, or a race of engines")
+    parser.add_argument("--engines", type=str, nargs="+", default=list(ENGINES), choices=list(ENGINES),
+                        help="Engines raced by the portfolio")
+    parser.add_argument("--timeout", type=float, default=None, help="Wall time limit of the portfolio, in seconds")
+    parser.add_argument("--models", type=int, default=None,
+                        help="Enumerate up to this many models (0 for all) over the directional closure")
+    parser.add_argument("--project", type=int, nargs="+", default=None,
+                        help="Variables the enumerated models are projected onto")
+    parser.add_argument("--log", type=str, default=None, help="Append the portfolio winner to this JSON lines file")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the local search")
+    parser.add_argument("--max-flips", type=int, default=10_000_000, help="Flip budget of the local search")
+    parser.add_argument("--order", type=str, default="input", choices=list(ORDERINGS),
+                        help="Variable order heuristic used by RES-SAT")
+    parser.add_argument("--closure", type=str, default="full", choices=["full", "directional", "external"],
+                        help="Resolution closure to compute")
+    parser.add_argument("--store", type=str, default="frozenset", choices=["frozenset", "arena"],
+                        help="Clause store used by the full closure")
+    parser.add_argument("--memory", type=int, default=256,
+                        help="Memory ceiling of the external closure, in MB")
+    parser.add_argument("--checkpoint", type=str, default=None,
+                        help="Periodically save the closure state to this file")
+    parser.add_argument("--checkpoint-interval", type=float, default=300,
+                        help="Seconds between closure checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the closure from the checkpoint (default: <file>.ckpt)")
     args = parser.parse_args()
+    if (args.checkpoint or args.resume) and (args.engine != "res-sat" or args.models is not None
+                                             or args.closure != "full" or args.store != "frozenset"):
+        parser.error("--checkpoint and --resume need the full closure with the frozenset store "
+                     "(--engine res-sat --closure full --store frozenset)")
+    if args.resume and args.checkpoint is None:
+        args.checkpoint = f"{args.f}.ckpt"
 
-    solver = RSSolver(args.f)  # Replace with your CNF file path
-    solution, res = solver.solve()
+    if args.models is not None:
+        solver = RSSolver(args.f, parser=Parser(args.f, ordering=args.order, closure="directional", verbose=False))
+        count = 0
+        for model in solver.models(limit=args.models or None, projection=args.project):
+            count += 1
+            print(" ".join(map(str, model)))
+        print(f"{count} models")
+        raise SystemExit
+
+    if args.engine == "portfolio":
+        winner = race(args.f, args.engines, timeout=args.timeout, seed=args.seed, verbose=True)
+        if args.log:
+            with open(args.log, 'a') as log:
+                log.write(json.dumps({"file": args.f, "engine": winner["engine"], "sat": winner["sat"],
+                                      "elapsed": winner["elapsed"]}) + "\n")
+        if winner["engine"] is None:
+            # No engine was definitive in time, so there is no verdict to check
+            print(f"Portfolio: unknown, no engine was definitive after {winner['elapsed']:.2f}s")
+            raise SystemExit
+        print(f"Portfolio: {winner['engine']} won in {winner['elapsed']:.2f}s")
+        solver = RSSolver(args.f, verbose=True, parser=Parser(args.f, closure="none", verbose=False))
+        solver.T = winner["model"]
+        solution, res = solver.check()
+    elif args.engine == "local":
+        # Local search needs no closure; its model goes through the same clause check as RES-SAT's
+        solver = RSSolver(args.f, verbose=True, parser=Parser(args.f, closure="none", verbose=False))
+        search = LocalSearch(solver.parser.data, solver.parser.num_vars, seed=args.seed,
+                             max_flips=args.max_flips, verbose=True)
+        model = search.solve()
+        if model is None:
+            # Local search never proves UNSAT, so an exhausted budget is no verdict
+            print("unknown (budget exhausted)")
+            raise SystemExit
+        solver.T = model
+        solution, res = solver.check()
+    else:
+        solver = RSSolver(args.f, verbose=True, ordering=args.order, closure=args.closure, store=args.store,
+                          memory=args.memory << 20, checkpoint=args.checkpoint,
+                          checkpoint_interval=args.checkpoint_interval, resume=args.resume)  # Replace with your CNF file path
+        solution, res = solver.solve()
     print(solution)
     # print(res)
 
@@ -0,0 +1,89 @@
+import hashlib
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, List, NamedTuple
+
+MAGIC = b"RESCKPT1"
+HEADER = struct.Struct("<qqqqd32s")  # round, position, pairs, resolvents, elapsed, fingerprint
+
+
+class Checkpoint(NamedTuple):
+    """
+    State of Parser.compute_RES between two frontier clauses.
+    """
+    round: int
+    position: int          # Index of the next frontier clause to resolve
+    old: List[frozenset]   # Clauses of R already resolved against each other
+    frontier: List[frozenset]  # Clauses added by the previous round
+    new: List[frozenset]   # Resolvents found so far in this round
+    stats: Dict[str, float]
+    fingerprint: bytes
+
+
+def fingerprint(clauses: Iterable[frozenset]) -> bytes:
+    """
+    Digest of a clause set, used to refuse resuming on a different formula.
+    """
+    digest = hashlib.sha256()
+    for clause in sorted(sorted(c) for c in clauses):
+        digest.update(_encode([clause]))
+    return digest.digest()
+
+
+def _encode(clauses: Iterable[Iterable[int]]) -> bytes:
+    data = array('i')
+    for clause in clauses:
+        clause = sorted(clause)
+        data.append(len(clause))
+        data.extend(clause)
+    return data.tobytes()
+
+
+def _decode(data: array, pos: int, count: int):
+    clauses = []
+    for _ in range(count):
+        n = data[pos]
+        clauses.append(frozenset(data[pos + 1:pos + 1 + n]))
+        pos += n + 1
+    return clauses, pos
+
+
+def save_checkpoint(path: str, state: Checkpoint):
+    """
+    Writes a checkpoint atomically: the file is written and synced under a
+    temporary name, then renamed over the previous checkpoint.
+    """
+    sections = (state.old, state.frontier, state.new)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as file:
+        file.write(MAGIC)
+        file.write(HEADER.pack(state.round, state.position, int(state.stats["pairs"]),
+                               int(state.stats["resolvents"]), state.stats["elapsed"], state.fingerprint))
+        file.write(struct.pack("<qqq", *map(len, sections)))
+        for section in sections:
+            file.write(_encode(section))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    with open(path, 'rb') as file:
+        raw = file.read()
+    if raw[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a RES closure checkpoint")
+    pos = len(MAGIC)
+    round_, position, pairs, resolvents, elapsed, digest = HEADER.unpack_from(raw, pos)
+    pos += HEADER.size
+    counts = struct.unpack_from("<qqq", raw, pos)
+    pos += 24
+
+    data = array('i')
+    data.frombytes(raw[pos:])
+    sections, pos = [], 0
+    for count in counts:
+        clauses, pos = _decode(data, pos, count)
+        sections.append(clauses)
+    stats = {"pairs": pairs, "resolvents": resolvents, "elapsed": elapsed}
+    return Checkpoint(round_, position, *sections, stats, digest)
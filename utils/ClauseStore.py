@@ -0,0 +1,96 @@
+from array import array
+from typing import Iterable, Iterator, Tuple
+
+
+class ClauseStore:
+    """
+    Hash-consed clause store. The literals of every clause live in one
+    contiguous array('i') arena, sorted, and each clause is identified by its
+    index (clause ID). Deduplication goes through an open-addressing hash
+    table of clause IDs keyed by the clause's frozenset hash, so no
+    per-clause Python object is kept alive.
+    """
+
+    EMPTY = -1
+
+    def __init__(self, capacity: int = 1 << 10):
+        self.lits = array('i')        # Literal arena
+        self.offsets = array('q', [0])  # Clause i spans lits[offsets[i]:offsets[i + 1]]
+        self.hashes = array('q')      # Cached hash of each clause, used when growing the table
+        size = 1
+        while size < 2 * capacity:
+            size <<= 1
+        self.table = array('q', [self.EMPTY]) * size
+        self.mask = size - 1
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, cid: int) -> Tuple[int, ...]:
+        return tuple(self.lits[self.offsets[cid]:self.offsets[cid + 1]])
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        for cid in range(len(self)):
+            yield self[cid]
+
+    def __repr__(self) -> str:
+        return f"ClauseStore({{{', '.join(map(str, self))}}})"
+
+    def __contains__(self, clause: Iterable[int]) -> bool:
+        return self.__find__(frozenset(clause))[1] != self.EMPTY
+
+    def __find__(self, clause: frozenset) -> Tuple[int, int]:
+        """
+        Returns the table slot for the given clause and the ID stored there,
+        EMPTY if the clause is not in the store. The hash of a frozenset does
+        not depend on the order of its literals, so lookups never sort.
+        """
+        h = hash(clause)
+        table, hashes, lits, offsets = self.table, self.hashes, self.lits, self.offsets
+        slot = h & self.mask
+        while (cid := table[slot]) != self.EMPTY:
+            start, end = offsets[cid], offsets[cid + 1]
+            if hashes[cid] == h and end - start == len(clause) and clause.issuperset(lits[start:end]):
+                return slot, cid
+            slot = (slot + 1) & self.mask
+        return slot, cid
+
+    def __grow__(self):
+        size = 2 * len(self.table)
+        self.table = array('q', [self.EMPTY]) * size
+        self.mask = size - 1
+        for cid, h in enumerate(self.hashes):
+            slot = h & self.mask
+            while self.table[slot] != self.EMPTY:
+                slot = (slot + 1) & self.mask
+            self.table[slot] = cid
+
+    def add(self, clause: Iterable[int]) -> Tuple[int, bool]:
+        """
+        Interns a clause. Returns its clause ID and whether it was new.
+        """
+        clause = clause if isinstance(clause, frozenset) else frozenset(clause)
+        # __find__ inlined, this is the hot path of compute_RES_arena
+        h = hash(clause)
+        table, hashes, lits, offsets = self.table, self.hashes, self.lits, self.offsets
+        slot = h & self.mask
+        while (cid := table[slot]) != self.EMPTY:
+            start, end = offsets[cid], offsets[cid + 1]
+            if hashes[cid] == h and end - start == len(clause) and clause.issuperset(lits[start:end]):
+                return cid, False
+            slot = (slot + 1) & self.mask
+
+        cid = len(offsets) - 1
+        lits.extend(sorted(clause))
+        offsets.append(len(lits))
+        hashes.append(h)
+        self.table[slot] = cid
+        if 2 * len(self) > len(self.table):  # Keep the load factor below 1/2
+            self.__grow__()
+        return cid, True
+
+    def nbytes(self) -> int:
+        """
+        Memory held by the store's buffers, in bytes.
+        """
+        return sum(a.itemsize * a.buffer_info()[1] for a in (self.lits, self.offsets, self.hashes, self.table))
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import os
+import signal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+from utils.Parser import Parser
+from utils.Solver import RSSolver
+
+DEFAULT_SOCKET = "/tmp/ressat.sock"
+# Parser options a request may set; everything else is fixed by the daemon
+OPTIONS = ("ordering", "closure", "store", "memory")
+
+
+class SolverDaemon:
+    """
+    Long-running RES-SAT service on a Unix domain socket. Parsed instances and
+    their closures stay warm in an LRU cache keyed by the file's identity and
+    the Parser options, so repeated queries skip parsing and closure entirely.
+    Parsing, closure and solving run in a thread pool, and concurrent requests
+    for an instance that is still being computed share the same computation.
+
+    Requests and responses are newline-delimited JSON objects:
+        {"op": "solve", "file": "aim/aim-50-1_6-yes1-1.cnf", "options": {"closure": "directional"}}
+        {"op": "validate", "file": "...", "model": [1, -2, ...], "options": {...}}
+        {"op": "stats"}
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, cache_size: int = 16, workers: int = 4):
+        self.socket_path = socket_path
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[Tuple, asyncio.Future]" = OrderedDict()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.stats = {"requests": 0, "hits": 0, "misses": 0, "errors": 0}
+
+    def __key__(self, path: str, options: Dict) -> Tuple:
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size) + tuple(sorted(options.items()))
+
+    async def __parser__(self, path: str, options: Dict) -> Parser:
+        options = {k: v for k, v in options.items() if k in OPTIONS}
+        key = self.__key__(path, options)
+        if key in self.cache:
+            self.stats["hits"] += 1
+            self.cache.move_to_end(key)
+        else:
+            self.stats["misses"] += 1
+            loop = asyncio.get_running_loop()
+            self.cache[key] = loop.run_in_executor(self.executor, lambda: Parser(path, verbose=False, **options))
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        future = self.cache[key]
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            if self.cache.get(key) is future:
+                del self.cache[key]
+            raise
+
+    async def __run__(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def dispatch(self, request: Dict) -> Dict:
+        op = request.get("op")
+        if op == "stats":
+            return {"ok": True, "cached": len(self.cache), **self.stats}
+
+        path = request["file"]
+        parser = await self.__parser__(path, request.get("options", {}))
+        solver = RSSolver(path, parser=parser)
+        if op == "solve":
+            sat, res = await self.__run__(solver.solve)
+            return {"ok": True, "sat": sat, "model": solver.T, "res": res}
+        if op == "validate":
+            valid = await self.__run__(solver.validate, request["model"])
+            return {"ok": True, "valid": valid}
+        raise ValueError(f"Unknown op '{op}'")
+
+    async def __handle__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                self.stats["requests"] += 1
+                try:
+                    response = await self.dispatch(json.loads(line))
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except asyncio.CancelledError:
+            pass  # The daemon is shutting down, the connection is simply dropped
+        finally:
+            writer.close()
+
+    async def serve(self):
+        """
+        Serves until cancelled, e.g. by SIGTERM, then removes the socket file.
+        Parser threads that are still computing a closure cannot be stopped,
+        so the caller should end the process with os._exit (see daemon.py).
+        """
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(self.__handle__, path=self.socket_path, limit=1 << 26)
+        print(f"RES-SAT daemon listening on {self.socket_path}")
+        # Shut down cleanly on SIGTERM so the socket file is removed
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
@@ -0,0 +1,217 @@
+import heapq
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import weakref
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from tqdm import tqdm
+
+Clause = Tuple[int, ...]
+
+# Rough in-memory footprint of one buffered clause (tuple, its ints and the set slot)
+CLAUSE_BYTES = 256
+# Maximum number of runs merged at once, bounded by open file descriptors
+FAN_IN = 64
+
+
+def write_run(path: str, clauses: Iterable[Clause]) -> int:
+    """
+    Writes clauses as length-prefixed int32 records. Returns the clause count.
+    """
+    count = 0
+    with open(path, 'wb') as file:
+        for clause in clauses:
+            file.write(encode(clause))
+            count += 1
+    return count
+
+
+def encode(clause: Clause) -> bytes:
+    return array('i', (len(clause),) + clause).tobytes()
+
+
+def read_run(path: str) -> Iterator[Clause]:
+    """
+    Streams the clauses of a run file through a read-only memory map.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos, end = 0, len(mm)
+        while pos < end:
+            (n,) = struct.unpack_from('i', mm, pos)
+            yield struct.unpack_from(f'{n}i', mm, pos + 4)
+            pos += 4 * (n + 1)
+
+
+def merge_unique(*runs: Iterable[Clause]) -> Iterator[Clause]:
+    """
+    Merges sorted runs, dropping duplicate clauses.
+    """
+    last = None
+    for clause in heapq.merge(*runs):
+        if clause != last:
+            yield clause
+            last = clause
+
+
+def difference(run: Iterable[Clause], other: Iterable[Clause]) -> Iterator[Clause]:
+    """
+    Yields the clauses of a sorted run that are not in another sorted run.
+    """
+    other = iter(other)
+    cur = next(other, None)
+    for clause in run:
+        while cur is not None and cur < clause:
+            cur = next(other, None)
+        if clause != cur:
+            yield clause
+
+
+class ExternalClosure:
+    """
+    Out-of-core resolution closure. All clauses live on disk in a sorted,
+    deduplicated run, and each variable has a bucket file holding every
+    clause that mentions it. Each round resolves the clauses added by the
+    previous round (the delta) against the bucket of every variable they
+    mention. Resolvents are buffered up to the memory ceiling, spilled as
+    sorted runs, and merged against the main run to find the next delta.
+    The result is the same closure as Parser.compute_RES.
+    """
+
+    def __init__(self, clauses: Iterable[frozenset], memory: int = 1 << 28, workdir: Optional[str] = None,
+                 verbose: bool = True):
+        self.verbose = verbose
+        self.capacity = max(1, memory // (2 * CLAUSE_BYTES))  # Clauses held per buffer
+        if workdir is None:
+            workdir = tempfile.mkdtemp(prefix="res-closure-")
+            self.__finalizer__ = weakref.finalize(self, shutil.rmtree, workdir, True)
+        os.makedirs(workdir, exist_ok=True)
+        self.workdir = workdir
+        self.vars = set()
+        self.runs = 0
+        self.round = 0
+
+        initial = sorted({tuple(sorted(clause)) for clause in clauses})
+        self.size = write_run(self.__path__("all"), initial)
+        write_run(self.__path__("delta"), initial)
+        self.__distribute__()
+
+    def __path__(self, name: str) -> str:
+        return os.path.join(self.workdir, f"{name}.run")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Clause]:
+        return read_run(self.__path__("all"))
+
+    def __repr__(self) -> str:
+        # The closure may not fit in memory, so only its size and location are shown
+        return f"ExternalClosure({self.size} clauses in {self.__path__('all')})"
+
+    def __distribute__(self):
+        """
+        Appends the delta to the bucket files and rebuilds the per-variable
+        delta buckets.
+        """
+        for var in self.vars:
+            open(self.__path__(f"delta{var}"), 'wb').close()
+        pending: Dict[int, bytearray] = {}
+        buffered = 0
+        for clause in read_run(self.__path__("delta")):
+            record = encode(clause)
+            for var in {abs(lit) for lit in clause}:
+                pending.setdefault(var, bytearray()).extend(record)
+                buffered += 1
+            if buffered >= self.capacity:
+                self.__flush__(pending)
+                buffered = 0
+        self.__flush__(pending)
+
+    def __flush__(self, pending: Dict[int, bytearray]):
+        for var, records in pending.items():
+            self.vars.add(var)
+            for name in (f"var{var}", f"delta{var}"):
+                with open(self.__path__(name), 'ab') as file:
+                    file.write(records)
+        pending.clear()
+
+    def __spill__(self, buffer: set) -> str:
+        path = self.__path__(f"spill{self.runs}")
+        self.runs += 1
+        write_run(path, sorted(buffer))
+        buffer.clear()
+        return path
+
+    def __merge__(self, spills: list) -> list:
+        """
+        Merges spilled runs in passes of at most FAN_IN runs each, until few
+        enough remain to be merged in one go.
+        """
+        while len(spills) > FAN_IN:
+            merged = []
+            for i in range(0, len(spills), FAN_IN):
+                group = spills[i:i + FAN_IN]
+                path = self.__path__(f"spill{self.runs}")
+                self.runs += 1
+                write_run(path, merge_unique(*map(read_run, group)))
+                for old in group:
+                    os.remove(old)
+                merged.append(path)
+            spills = merged
+        return spills
+
+    def step(self) -> int:
+        """
+        Performs one resolution round. Returns the number of new clauses.
+        """
+        spills = []
+        buffer = set()
+        for var in tqdm(sorted(self.vars), disable=not self.verbose):
+            delta = read_run(self.__path__(f"delta{var}"))
+            while True:
+                chunk = list(islice(delta, self.capacity))
+                if not chunk:
+                    break
+                partners = {var: [d for d in chunk if -var in d], -var: [d for d in chunk if var in d]}
+                for clause in read_run(self.__path__(f"var{var}")):
+                    for lit in (var, -var):
+                        if lit not in clause:
+                            continue
+                        for other in partners[lit]:
+                            new_clause = set(clause)
+                            new_clause.discard(lit)
+                            new_clause.update(oth for oth in other if oth != -lit)
+                            if new_clause:
+                                buffer.add(tuple(sorted(new_clause)))
+                    if len(buffer) >= self.capacity:
+                        spills.append(self.__spill__(buffer))
+        if buffer:
+            spills.append(self.__spill__(buffer))
+
+        spills = self.__merge__(spills)
+
+        # Final merge pass: dedup the spilled runs, drop known clauses, fold the rest into the main run
+        count = write_run(self.__path__("delta"),
+                          difference(merge_unique(*map(read_run, spills)), read_run(self.__path__("all"))))
+        for path in spills:
+            os.remove(path)
+        if count:
+            write_run(self.__path__("merged"),
+                      merge_unique(read_run(self.__path__("all")), read_run(self.__path__("delta"))))
+            os.replace(self.__path__("merged"), self.__path__("all"))
+            self.size += count
+            self.__distribute__()
+        self.round += 1
+        return count
+
+    def compute(self):
+        while self.step():
+            pass
+        return self
@@ -0,0 +1,160 @@
+import random
+import time
+from array import array
+from typing import Iterable, List, Optional
+
+
+class LocalSearch:
+    """
+    WalkSAT-style stochastic local search for satisfiable instances.
+    Clauses are kept in CSR form (one literal array plus clause offsets) and
+    so are the occurrence lists of every literal. Per clause the number of
+    true literals and the XOR of their variables are maintained, which gives
+    the critical variable of a clause with one true literal in O(1). Break and
+    make counts of every variable and the list of false clauses are updated
+    incrementally, so a flip only touches the clauses the variable occurs in.
+    """
+
+    def __init__(self, clauses: Iterable[frozenset], num_vars: int, seed: int = 0, max_flips: int = 10_000_000,
+                 noise: float = 0.567, verbose: bool = False):
+        self.seed = seed
+        self.max_flips = max_flips
+        self.noise = noise
+        self.verbose = verbose
+        self.flips = 0
+        self.elapsed = 0.0
+
+        clauses = [sorted(clause) for clause in clauses]
+        self.num_vars = max([num_vars] + [abs(lit) for clause in clauses for lit in clause])
+        # Tautologies are always satisfied, and a clause holding both literals of a
+        # variable would count as breaking for it and corrupt the XOR of true variables
+        clauses = [clause for clause in clauses if not any(-lit in clause for lit in clause)]
+        self.num_clauses = len(clauses)
+        self.lits = array('i')
+        self.offsets = array('q', [0])
+        for clause in clauses:
+            self.lits.extend(clause)
+            self.offsets.append(len(self.lits))
+        self.vars = array('i', map(abs, self.lits))  # Variable of every literal, saves abs() in the hot loop
+
+        # Occurrence lists in CSR form, indexed by literal slot 2 * var + (lit < 0)
+        counts = array('q', [0]) * (2 * self.num_vars + 3)
+        for lit in self.lits:
+            counts[self.__slot__(lit) + 1] += 1
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+        self.occ_offsets = array('q', counts)
+        self.occ = array('i', [0]) * len(self.lits)
+        fill = array('q', counts)
+        for cid in range(self.num_clauses):
+            for k in range(self.offsets[cid], self.offsets[cid + 1]):
+                slot = self.__slot__(self.lits[k])
+                self.occ[fill[slot]] = cid
+                fill[slot] += 1
+
+    @staticmethod
+    def __slot__(lit: int) -> int:
+        return 2 * lit if lit > 0 else -2 * lit + 1
+
+    def __init_state__(self, rng: random.Random):
+        n, m = self.num_vars, self.num_clauses
+        self.value = array('b', [0]) + array('b', (rng.random() < 0.5 for _ in range(n)))
+        self.num_true = array('i', [0]) * m
+        self.true_xor = array('i', [0]) * m
+        self.breaks = array('i', [0]) * (n + 1)
+        self.makes = array('i', [0]) * (n + 1)
+        self.false = array('i')                 # Unsatisfied clause IDs
+        self.where = array('i', [-1]) * m       # Position of each clause in self.false, -1 if satisfied
+
+        lits, offsets, value = self.lits, self.offsets, self.value
+        for cid in range(m):
+            for k in range(offsets[cid], offsets[cid + 1]):
+                lit = lits[k]
+                if (lit > 0) == bool(value[abs(lit)]):
+                    self.num_true[cid] += 1
+                    self.true_xor[cid] ^= abs(lit)
+            if self.num_true[cid] == 0:
+                self.where[cid] = len(self.false)
+                self.false.append(cid)
+                for k in range(offsets[cid], offsets[cid + 1]):
+                    self.makes[abs(lits[k])] += 1
+            elif self.num_true[cid] == 1:
+                self.breaks[self.true_xor[cid]] += 1
+
+    def flip(self, var: int):
+        """
+        Flips a variable and updates counts for the clauses it occurs in.
+        """
+        cvars, offsets, occ, occ_offsets = self.vars, self.offsets, self.occ, self.occ_offsets
+        num_true, true_xor, breaks, makes = self.num_true, self.true_xor, self.breaks, self.makes
+        self.value[var] ^= 1
+        made = var if self.value[var] else -var  # Literal that just became true
+
+        s = self.__slot__(made)
+        for cid in occ[occ_offsets[s]:occ_offsets[s + 1]]:
+            num_true[cid] += 1
+            true_xor[cid] ^= var
+            if num_true[cid] == 1:
+                # Clause becomes satisfied: remove it from the false list
+                last = self.false.pop()
+                if last != cid:
+                    pos = self.where[cid]
+                    self.false[pos] = last
+                    self.where[last] = pos
+                self.where[cid] = -1
+                for u in cvars[offsets[cid]:offsets[cid + 1]]:
+                    makes[u] -= 1
+                breaks[var] += 1
+            elif num_true[cid] == 2:
+                breaks[true_xor[cid] ^ var] -= 1
+
+        s = self.__slot__(-made)
+        for cid in occ[occ_offsets[s]:occ_offsets[s + 1]]:
+            num_true[cid] -= 1
+            true_xor[cid] ^= var
+            if num_true[cid] == 0:
+                # Clause becomes falsified
+                self.where[cid] = len(self.false)
+                self.false.append(cid)
+                for u in cvars[offsets[cid]:offsets[cid + 1]]:
+                    makes[u] += 1
+                breaks[var] -= 1
+            elif num_true[cid] == 1:
+                breaks[true_xor[cid]] += 1
+        self.flips += 1
+
+    def __pick__(self, rng: random.Random, cid: int) -> int:
+        clause = self.lits[self.offsets[cid]:self.offsets[cid + 1]]
+        best, candidates = None, []
+        for lit in clause:
+            var = abs(lit)
+            score = (self.breaks[var], -self.makes[var])
+            if best is None or score < best:
+                best, candidates = score, [var]
+            elif score == best:
+                candidates.append(var)
+        if best[0] > 0 and rng.random() < self.noise:
+            return abs(rng.choice(clause))
+        return rng.choice(candidates)
+
+    def solve(self) -> Optional[List[int]]:
+        """
+        Searches for a model within the flip budget. Returns it as a list of
+        literals, or None if the budget ran out.
+        """
+        rng = random.Random(self.seed)
+        start = time.perf_counter()
+        self.__init_state__(rng)
+        self.flips = 0
+        while self.false and self.flips < self.max_flips:
+            self.flip(self.__pick__(rng, self.false[rng.randrange(len(self.false))]))
+        self.elapsed = time.perf_counter() - start
+        if self.verbose:
+            print(f"Local search: {self.flips} flips in {self.elapsed:.2f}s "
+                  f"({self.flips_per_second():.0f} flips/s), {len(self.false)} clauses false")
+        if self.false:
+            return None
+        return [var if self.value[var] else -var for var in range(1, self.num_vars + 1)]
+
+    def flips_per_second(self) -> float:
+        return self.flips / self.elapsed if self.elapsed > 0 else 0.0
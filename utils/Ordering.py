@@ -0,0 +1,87 @@
+from typing import Callable, Dict, Iterable, List, Set
+
+
+def primal_graph(clauses: Iterable[frozenset], num_vars: int) -> Dict[int, Set[int]]:
+    """
+    Builds the primal (interaction) graph of a CNF formula: one vertex per
+    variable, with an edge between every two variables sharing a clause.
+    """
+    graph = {v: set() for v in range(1, num_vars + 1)}
+    for clause in clauses:
+        variables = {abs(lit) for lit in clause}
+        for v in variables:
+            graph.setdefault(v, set()).update(variables - {v})
+    return graph
+
+
+def _eliminate(graph: Dict[int, Set[int]], score: Callable) -> List[int]:
+    """
+    Greedy elimination: repeatedly removes the vertex with the lowest score,
+    connecting its remaining neighbours. Returns the elimination sequence.
+    """
+    graph = {v: set(nbrs) for v, nbrs in graph.items()}
+    sequence = []
+    while graph:
+        v = min(graph, key=lambda u: (score(graph, u), u))
+        nbrs = graph.pop(v)
+        for u in nbrs:
+            graph[u].discard(v)
+            graph[u].update(nbrs - {u})
+        sequence.append(v)
+    return sequence
+
+
+def _degree(graph: Dict[int, Set[int]], v: int) -> int:
+    return len(graph[v])
+
+
+def _fill(graph: Dict[int, Set[int]], v: int) -> int:
+    nbrs = list(graph[v])
+    return sum(1 for i, a in enumerate(nbrs) for b in nbrs[i + 1:] if b not in graph[a])
+
+
+def input_order(graph: Dict[int, Set[int]]) -> List[int]:
+    return sorted(graph)
+
+
+def min_degree_order(graph: Dict[int, Set[int]]) -> List[int]:
+    # Variables eliminated first are assigned last by RES-SAT
+    return _eliminate(graph, _degree)[::-1]
+
+
+def min_fill_order(graph: Dict[int, Set[int]]) -> List[int]:
+    return _eliminate(graph, _fill)[::-1]
+
+
+ORDERINGS = {
+    "input": input_order,
+    "min-degree": min_degree_order,
+    "min-fill": min_fill_order,
+}
+
+
+def induced_width(graph: Dict[int, Set[int]], order: List[int]) -> int:
+    """
+    Width of the given assignment order: the largest number of earlier
+    neighbours any variable has once later variables are eliminated.
+    Directional resolution is exponential in this number.
+    """
+    graph = {v: set(nbrs) for v, nbrs in graph.items()}
+    width = 0
+    for v in reversed(order):
+        nbrs = graph.pop(v)
+        width = max(width, len(nbrs))
+        for u in nbrs:
+            graph[u].discard(v)
+            graph[u].update(nbrs - {u})
+    return width
+
+
+def compute_order(clauses: Iterable[frozenset], num_vars: int, heuristic: str = "input") -> List[int]:
+    """
+    Returns the variables of the formula in the order RES-SAT should assign
+    them, according to the named heuristic.
+    """
+    if heuristic not in ORDERINGS:
+        raise ValueError(f"Unknown ordering '{heuristic}', expected one of {list(ORDERINGS)}")
+    return ORDERINGS[heuristic](primal_graph(clauses, num_vars))
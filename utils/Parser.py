@@ -1,17 +1,55 @@
+import os
+import time
 from typing import List, Set
-from itertools import combinations
+from array import array
+from itertools import chain, islice
 from tqdm import tqdm
+from utils.Checkpoint import Checkpoint, fingerprint, load_checkpoint, save_checkpoint
+from utils.ClauseStore import ClauseStore
+from utils.External import ExternalClosure
+from utils.Ordering import compute_order
+
+CLOSURES = ("full", "directional", "external", "none")
+STORES = ("frozenset", "arena")
 
 class Parser:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, ordering: str = "input", closure: str = "full", store: str = "frozenset",
+                 memory: int = 1 << 28, checkpoint: str = None, checkpoint_interval: float = 300,
+                 resume: bool = False, verbose: bool = True):
         self.path = file_path
         self.num_vars = 0
         self.num_clauses = 0
+        self.store = store
+        self.memory = memory
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.resume = resume
+        self.verbose = verbose
+        self.stats = None  # Closure statistics, only kept by the checkpointed compute_RES
         self.R = set()
+        if closure not in CLOSURES:
+            raise ValueError(f"Unknown closure '{closure}', expected one of {list(CLOSURES)}")
+        if store not in STORES:
+            raise ValueError(f"Unknown store '{store}', expected one of {list(STORES)}")
+        if (checkpoint or resume) and (closure != "full" or store != "frozenset"):
+            raise ValueError("Checkpoints are only supported by the full closure with the frozenset store")
         self.data = self.__read_cnf__()
-        self.compute_RES()
-        print(self.data)
-        print(self.R)
+        # order[k - 1] is the original variable renumbered to k
+        self.order = compute_order(self.data, self.num_vars, ordering)
+        self.index = {v: k for k, v in enumerate(self.order, start=1)}
+        if ordering != "input":
+            self.data = {frozenset(self.renumber(lit) for lit in clause) for clause in self.data}
+        if closure == "directional":
+            self.compute_DR()
+        elif closure == "external":
+            self.compute_EXT()
+        elif closure == "none":
+            pass  # Engines that work on the clauses directly (see utils.LocalSearch)
+        elif closure == "full":
+            self.compute_RES()
+        if self.verbose:
+            print(self.data)
+            print(self.R)
     def __read_cnf__(self) -> Set[frozenset]:
         clauses = set()
         with open(self.path, 'r') as file:
@@ -28,6 +66,18 @@ class Parser:
                 if literals:  # Ensure non-empty clause before adding
                     clauses.add(frozenset(literals))
         return clauses
+
+    def renumber(self, lit: int) -> int:
+        """
+        Maps a literal of the input file to the working numbering.
+        """
+        return self.index[abs(lit)] if lit > 0 else -self.index[abs(lit)]
+
+    def original(self, lit: int) -> int:
+        """
+        Maps a literal of the working numbering back to the input file.
+        """
+        return self.order[abs(lit) - 1] if lit > 0 else -self.order[abs(lit) - 1]
     
     def resolve(self, c1: frozenset, c2: frozenset) -> Set[frozenset]:
         """
@@ -45,22 +95,211 @@ class Parser:
     def compute_RES(self):
         """
         Computes the resolution closure of the given CNF formula.
+        Clauses added by the previous round form the frontier, and each round
+        resolves every frontier clause against the later frontier clauses and
+        the older clauses of R. The state between two frontier clauses can be
+        checkpointed to self.checkpoint and resumed from it (see utils.Checkpoint).
         """
-        self.R = set(self.data)  # Start with original clauses
-        new_resolvents = set()
-        
-        print("Computing RES closure...")
-        while True:
-            for c1, c2 in tqdm(list(combinations(self.R, 2))):
-                resolvents = self.resolve(c1, c2)
-                new_resolvents.update(resolvents - self.R)
-                # if len(self.R) + len(new_resolvents) > self.max_clauses:
-                #     print("Max clause limit reached. Stopping RES computation.")
-                #     return
-            
-            if not new_resolvents:
-                break  # No new resolvents, stop
-            
-            self.R.update(new_resolvents)
-            new_resolvents.clear()
-        print("RES computation complete.")
\ No newline at end of file
+        if self.store == "arena":
+            return self.compute_RES_arena()
+
+        digest = fingerprint(self.data) if self.checkpoint else None
+        if self.resume and self.checkpoint and os.path.exists(self.checkpoint):
+            state = load_checkpoint(self.checkpoint)
+            if state.fingerprint != digest:
+                raise ValueError(f"Checkpoint {self.checkpoint} was written for a different formula")
+            round_, start, old, frontier, self.stats = state.round, state.position, state.old, state.frontier, state.stats
+            new_resolvents = set(state.new)
+        else:
+            round_, start, old, frontier = 0, 0, [], sorted(self.data, key=sorted)
+            new_resolvents = set()
+            self.stats = {"pairs": 0, "resolvents": 0, "elapsed": 0.0}
+        self.R = set(old)
+        self.R.update(frontier)
+
+        def save(position: int):
+            self.stats["elapsed"] += time.perf_counter() - self.__clock__
+            self.__clock__ = time.perf_counter()
+            save_checkpoint(self.checkpoint, Checkpoint(round_, position, old, frontier,
+                                                        sorted(new_resolvents, key=sorted), self.stats, digest))
+
+        if self.verbose:
+            print("Computing RES closure...")
+        self.__clock__ = last_save = time.perf_counter()
+        position = start  # Next frontier clause not fully resolved yet
+        try:
+            while frontier:
+                for i in tqdm(range(start, len(frontier)), disable=not self.verbose):
+                    position = i
+                    c1 = frontier[i]
+                    for c2 in chain(islice(frontier, i + 1, None), old):
+                        resolvents = self.resolve(c1, c2)
+                        new_resolvents.update(resolvents - self.R)
+                    self.stats["pairs"] += len(frontier) - i - 1 + len(old)
+                    if self.checkpoint and time.perf_counter() - last_save >= self.checkpoint_interval:
+                        save(i + 1)
+                        last_save = time.perf_counter()
+
+                self.R.update(new_resolvents)
+                # The whole transition, stats included, is one assignment, so an interrupt
+                # saves either the finished round or the next one, never a mix of both
+                round_, start, position, old, frontier, new_resolvents, self.stats = (
+                    round_ + 1, 0, 0, old + frontier, sorted(new_resolvents, key=sorted), set(),
+                    {**self.stats, "resolvents": self.stats["resolvents"] + len(new_resolvents)})
+                if self.checkpoint:
+                    save(0)
+                    last_save = time.perf_counter()
+        except KeyboardInterrupt:
+            if self.checkpoint:
+                # The clause at position may be partly resolved, so it is redone on resume
+                save(position)
+                print(f"Interrupted, closure state saved to {self.checkpoint}")
+            raise
+        self.stats["elapsed"] += time.perf_counter() - self.__clock__
+        if self.verbose:
+            print("RES computation complete.")
+
+    def compute_RES_arena(self):
+        """
+        Computes the same resolution closure as compute_RES, but interns every
+        clause in a ClauseStore so the closure only holds clause IDs. Every
+        literal has an occurrence list of the IDs of the clauses it is in, and
+        each clause is resolved upon each of its literals against the clauses
+        with a lower ID in the occurrence list of the complement, so each
+        clashing pair is resolved exactly once and only clashing pairs are
+        decoded from the arena.
+        """
+        self.R = ClauseStore(len(self.data))
+        lits, offsets = self.R.lits, self.R.offsets
+        occ = {}  # Literal -> increasing IDs of the clauses containing it
+
+        def index(cid: int, clause: frozenset):
+            for lit in clause:
+                occ.setdefault(lit, array('i')).append(cid)
+
+        store = self.R.add
+        for clause in sorted(self.data, key=sorted):
+            cid, new = store(clause)
+            if new:
+                index(cid, clause)
+
+        if self.verbose:
+            print("Computing RES closure...")
+        j = 0
+        with tqdm(disable=not self.verbose) as progress:
+            while j < len(self.R):
+                c2 = lits[offsets[j]:offsets[j + 1]]
+                for lit in c2:
+                    # c2's side of every resolvent upon lit, and the literal dropped from the other side
+                    rest, drop = frozenset(oth for oth in c2 if oth != lit), frozenset((-lit,))
+                    if -lit in c2:
+                        drop = frozenset()
+                    for i in occ.get(-lit, ()):
+                        if i >= j:
+                            break  # IDs are increasing, later clauses resolve against c2 themselves
+                        new_clause = rest.union(lits[offsets[i]:offsets[i + 1]]) - drop
+                        if new_clause:
+                            cid, new = store(new_clause)
+                            if new:
+                                index(cid, new_clause)
+                j += 1
+                progress.update()
+        if self.verbose:
+            print("RES computation complete.")
+
+    def compute_EXT(self):
+        """
+        Computes the resolution closure on disk, holding at most about
+        self.memory bytes of clauses in memory (see utils.External).
+        """
+        if self.verbose:
+            print("Computing RES closure out of core...")
+        self.R = ExternalClosure(self.data, memory=self.memory, verbose=self.verbose).compute()
+        if self.verbose:
+            print("RES computation complete.")
+
+    def __subsumed__(self, clause: frozenset, buckets: dict) -> bool:
+        """
+        Checks whether some clause already in the buckets is a subset of the
+        given clause. Such a clause lies in the bucket of one of its variables.
+        """
+        for var in {abs(lit) for lit in clause}:
+            if any(c <= clause for c in buckets.get(var, ())):
+                return True
+        return False
+
+    def compute_DR(self):
+        """
+        Computes the directional resolution closure of the given CNF formula.
+        Clauses are bucketed by their highest variable and buckets are resolved
+        from the last variable down to the first, so only resolution upon the
+        highest variable is performed. This is sufficient for RES-SAT as long as
+        it assigns variables in increasing order, and its cost depends on the
+        variable order (see utils.Ordering).
+        """
+        buckets = {}
+        for clause in self.data:
+            buckets.setdefault(max(map(abs, clause)), set()).add(clause)
+
+        if self.verbose:
+            print("Computing DR closure...")
+        for var in tqdm(range(max(buckets, default=0), 0, -1), disable=not self.verbose):
+            bucket = buckets.get(var, ())
+            pos = [c for c in bucket if var in c]
+            neg = [c for c in bucket if -var in c]
+            for c1 in pos:
+                for c2 in neg:
+                    new_clause = (c1 - {var}) | (c2 - {-var})
+                    if not new_clause or any(-lit in new_clause for lit in new_clause):
+                        continue  # Empty clause or tautology
+                    if self.__subsumed__(new_clause, buckets):
+                        continue
+                    buckets.setdefault(max(map(abs, new_clause)), set()).add(frozenset(new_clause))
+
+        self.buckets = buckets
+        self.R = set().union(*buckets.values())
+        if self.verbose:
+            print("DR computation complete.")
+
+    def extend_DR(self, clause: frozenset, buckets: dict) -> int:
+        """
+        Adds a clause to a copy of the buckets computed by compute_DR and
+        resolves only the new clauses against their buckets, highest variable
+        first, instead of recomputing the closure. self.buckets and self.R are
+        left untouched, so a shared Parser keeps its closure. Clauses the new
+        ones subsume are removed, which keeps the buckets from growing with
+        every blocking clause during enumeration. Returns the lowest variable
+        whose bucket gained a clause, so RES-SAT assignments to lower
+        variables remain valid, or None if nothing was added.
+        """
+        pending = {}
+        lowest = None
+
+        def add(new_clause: frozenset):
+            nonlocal lowest
+            var = max(map(abs, new_clause))
+            # A clause containing new_clause mentions var, so it lies in bucket var or higher
+            for bucket in (buckets[v] for v in range(var, self.num_vars + 1) if v in buckets):
+                bucket.difference_update([c for c in bucket if new_clause <= c])
+            buckets.setdefault(var, set()).add(new_clause)
+            pending.setdefault(var, []).append(new_clause)
+            lowest = var if lowest is None else min(lowest, var)
+
+        if not self.__subsumed__(clause, buckets):
+            add(clause)
+        while pending:
+            var = max(pending)
+            for c1 in pending.pop(var):
+                if c1 not in buckets[var]:
+                    continue  # Subsumed by a clause added after it
+                lit = var if var in c1 else -var
+                for c2 in list(buckets[var]):
+                    if -lit not in c2:
+                        continue
+                    new_clause = (c1 - {lit}) | (c2 - {-lit})
+                    if not new_clause or any(-oth in new_clause for oth in new_clause):
+                        continue  # Empty clause or tautology
+                    if self.__subsumed__(new_clause, buckets):
+                        continue
+                    add(frozenset(new_clause))
+        return lowest
@@ -0,0 +1,138 @@
+import importlib.util
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Dict, List, Optional, Tuple
+
+from utils.LocalSearch import LocalSearch
+from utils.Parser import Parser
+from utils.Solver import RSSolver
+
+V2_RES_SAT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "v2", "src", "res_sat.py")
+
+
+def res_sat(path: str, seed: int) -> Tuple[Optional[bool], List[int]]:
+    """
+    RES-SAT over the full closure. Complete: a failed assignment means UNSAT.
+    """
+    solver = RSSolver(path, parser=Parser(path, closure="full", verbose=False))
+    sat, _ = solver.solve()
+    return sat, solver.T
+
+
+def res_sat_directional(path: str, seed: int) -> Tuple[Optional[bool], List[int]]:
+    """
+    RES-SAT over the directional closure under a min-fill order. Also complete.
+    """
+    solver = RSSolver(path, parser=Parser(path, ordering="min-fill", closure="directional", verbose=False))
+    sat, _ = solver.solve()
+    return sat, solver.T
+
+
+def v2(path: str, seed: int) -> Tuple[Optional[bool], List[int]]:
+    """
+    The single greedy pass of v2/src/res_sat.py, without a closure. Only a
+    satisfying interpretation is definitive.
+    """
+    spec = importlib.util.spec_from_file_location("v2_res_sat", V2_RES_SAT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    parser = Parser(path, closure="none", verbose=False)
+    clauses = [list(clause) for clause in parser.data]
+    T = module.res_sat(parser.num_vars, clauses)
+    return (True if module.check_satisfiability(clauses, T) else None), sorted(T, key=abs)
+
+
+def local(path: str, seed: int) -> Tuple[Optional[bool], List[int]]:
+    """
+    Stochastic local search. Only finds models, never proves UNSAT.
+    """
+    parser = Parser(path, closure="none", verbose=False)
+    model = LocalSearch(parser.data, parser.num_vars, seed=seed).solve()
+    return (True, model) if model is not None else (None, [])
+
+
+ENGINES = {
+    "res-sat": res_sat,
+    "res-sat-dr": res_sat_directional,
+    "v2": v2,
+    "local": local,
+}
+
+
+def _worker(name: str, path: str, seed: int, results: Connection):
+    start = time.perf_counter()
+    try:
+        sat, model = ENGINES[name](path, seed)
+        results.send((name, sat, model, time.perf_counter() - start, None))
+    except Exception as e:
+        results.send((name, None, [], time.perf_counter() - start, f"{type(e).__name__}: {e}"))
+    finally:
+        results.close()
+
+
+def race(path: str, engines: List[str], timeout: float = None, seed: int = 0, verbose: bool = False) -> Dict:
+    """
+    Runs the given engines on the same file in parallel processes. The first
+    definitive verdict (SAT, or UNSAT from a complete engine) wins and the
+    other processes are terminated. Returns the winner's name, verdict, model
+    and wall time, or engine None if no engine was definitive in time. An
+    engine process that dies without a result (e.g. killed when out of
+    memory) counts as unknown.
+    """
+    for name in engines:
+        if name not in ENGINES:
+            raise ValueError(f"Unknown engine '{name}', expected one of {list(ENGINES)}")
+
+    start = time.perf_counter()
+    processes, readers = {}, {}
+    for name in engines:
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        processes[name] = multiprocessing.Process(target=_worker, args=(name, path, seed, writer), daemon=True)
+        processes[name].start()
+        writer.close()  # Only the child writes, so a dead child shows up as EOF
+        readers[name] = reader
+
+    winner = {"engine": None, "sat": None, "model": [], "elapsed": None}
+    pending = set(engines)
+    try:
+        while pending:
+            remaining = None if timeout is None else timeout - (time.perf_counter() - start)
+            if remaining is not None and remaining <= 0:
+                break
+            # Results and process exits are waited on together, so a crashed engine cannot hang the race
+            ready = wait([readers[name] for name in pending] + [processes[name].sentinel for name in pending],
+                         timeout=remaining)
+            if not ready:
+                break
+            for name in sorted(pending):
+                reader, process = readers[name], processes[name]
+                if reader not in ready and process.sentinel not in ready:
+                    continue
+                try:
+                    name, sat, model, elapsed, error = reader.recv()
+                except EOFError:
+                    process.join()
+                    sat, model, elapsed = None, [], time.perf_counter() - start
+                    error = f"process exited with code {process.exitcode} without a result"
+                pending.discard(name)
+                if verbose:
+                    status = error or {True: "SAT", False: "UNSAT", None: "unknown"}[sat]
+                    print(f"{name}: {status} after {elapsed:.2f}s")
+                if sat is not None:
+                    winner = {"engine": name, "sat": sat, "model": model, "elapsed": time.perf_counter() - start}
+                    break
+            if winner["engine"] is not None:
+                break
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in processes.values():
+            process.join()
+        for reader in readers.values():
+            reader.close()
+    if winner["elapsed"] is None:
+        winner["elapsed"] = time.perf_counter() - start
+    return winner
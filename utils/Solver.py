@@ -1,4 +1,4 @@
-from typing import List, Set, Dict
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 from utils.Parser import Parser
 import sys
 
@@ -139,24 +139,96 @@ import sys
 from utils.Parser import Parser
 
 class RSSolver:
-    def __init__(self, file_path: str, verbose: bool = False):
-        self.parser = Parser(file_path)
+    def __init__(self, file_path: str, verbose: bool = False, parser: Parser = None, **options):
+        # options are passed on to Parser (ordering, closure, store, memory, checkpoint, ...),
+        # unless an already computed parser is given
+        self.parser = parser if parser is not None else Parser(file_path, **options)
+        self.verbose = verbose
         self.T = []
         self.res = [False for _ in range(self.parser.num_clauses)]
 
     def solve(self) -> bool:
+        self.T = []  # Start over, models() leaves its last model here
         for i in range(1, self.parser.num_vars + 1):
             self.T.append(i)
             if self.__validate__():
                 self.T[-1] = -self.T[-1]
-            print(self.T[-1])
-
-        for i, clause in enumerate(self.parser.data):
-            if any(var in self.T for var in clause):
-                self.res[i] = True
-
+            if self.verbose:
+                print(self.T[-1])
+
+        # Map the model back to the variable numbering of the input file
+        self.T = sorted((self.parser.original(lit) for lit in self.T), key=abs)
+        return self.check()
+
+    def check(self) -> Tuple[bool, List[bool]]:
+        """
+        Marks which clauses of the formula the current model satisfies.
+        Also used to check models found by other engines (see utils.LocalSearch).
+        """
+        model = set(self.T)
+        self.res = [any(self.parser.original(lit) in model for lit in clause) for clause in self.parser.data]
         return all(self.res), self.res
 
+    def validate(self, model: List[int] = None) -> bool:
+        """
+        Checks a model, given in the numbering of the input file, against
+        every clause of the formula. Defaults to the model found by solve.
+        """
+        model = set(self.T if model is None else model)
+        return all(any(self.parser.original(lit) in model for lit in clause) for clause in self.parser.data)
+
+    def models(self, limit: int = None, projection: Iterable[int] = None) -> Iterator[List[int]]:
+        """
+        Lazily enumerates models, at most limit of them, restricted to the
+        projection variables (all variables by default, input numbering).
+        After each model a blocking clause over the projection is added with
+        Parser.extend_DR to a copy of the directional closure private to this
+        enumeration, so the parser can be shared and enumerated again. RES-SAT
+        resumes from the lowest variable the new clauses can affect, keeping
+        the assignment of every variable below it. Needs closure="directional".
+        """
+        if not hasattr(self.parser, "buckets"):
+            raise ValueError("Model enumeration needs the directional closure (closure='directional')")
+        buckets = {var: set(bucket) for var, bucket in self.parser.buckets.items()}
+        n = self.parser.num_vars
+        projection = set(range(1, n + 1) if projection is None else projection)
+        T, start, count = [], 1, 0
+        while limit is None or count < limit:
+            if not self.__assign__(T, start, buckets):
+                return  # The closure is complete, so a failed assignment means no models are left
+            self.T = sorted((self.parser.original(lit) for lit in T), key=abs)
+            self.check()
+            yield [lit for lit in self.T if abs(lit) in projection]
+            count += 1
+
+            block = frozenset(-lit for lit in self.T if abs(lit) in projection)
+            if not block:
+                return
+            lowest = self.parser.extend_DR(frozenset(self.parser.renumber(lit) for lit in block), buckets)
+            start = 1 if lowest is None else lowest
+
+    def __assign__(self, T: List[int], start: int, buckets: dict) -> bool:
+        """
+        RES-SAT assignment of variables start..n in working numbering, keeping
+        T's assignment of the variables below start. Only clauses whose highest
+        variable is i can be falsified when i is assigned, so only its bucket
+        in the given directional closure is checked. Returns False if both
+        polarities of some variable falsify a clause of its bucket, which over
+        a directional closure means the clauses have no model.
+        """
+        del T[start - 1:]
+        assigned = set(T)
+        for i in range(start, self.parser.num_vars + 1):
+            bucket = buckets.get(i, ())
+            assigned.add(i)
+            if any(all(-oth in assigned for oth in clause) for clause in bucket):
+                assigned.discard(i)
+                assigned.add(-i)
+                if any(all(-oth in assigned for oth in clause) for clause in bucket):
+                    return False
+            T.append(i if i in assigned else -i)
+        return True
+
     def __validate__(self) -> bool:
         for clause in self.parser.R:
             if all(-oth in self.T for oth in clause):